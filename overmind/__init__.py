@@ -3,25 +3,33 @@ Overmind Python Client
 
 A Python client for the Overmind API that provides automatic observability for
 LLM applications.
+
+Tracing helpers are imported lazily on first access, so importing a submodule
+such as ``overmind.layers`` does not pull in the OpenTelemetry exporter stack.
 """
 
-from opentelemetry.overmind.prompt import PromptString
+import importlib
+from typing import TYPE_CHECKING
 
 from .exceptions import OvermindAPIError, OvermindAuthenticationError, OvermindError
-from .tracing import (
-    SpanType,
-    capture_exception,
-    entry_point,
-    function,
-    get_tracer,
-    init,
-    observe,
-    set_tag,
-    set_user,
-    start_span,
-    tool,
-    workflow,
-)
+
+if TYPE_CHECKING:
+    from opentelemetry.overmind.prompt import PromptString
+
+    from .tracing import (
+        SpanType,
+        capture_exception,
+        entry_point,
+        function,
+        get_tracer,
+        init,
+        observe,
+        set_tag,
+        set_user,
+        start_span,
+        tool,
+        workflow,
+    )
 
 __version__ = "0.1.39"
 __all__ = [
@@ -42,3 +50,40 @@ __all__ = [
     "tool",
     "workflow",
 ]
+
+_LAZY_ATTRIBUTES = {
+    "PromptString": "opentelemetry.overmind.prompt",
+    "SpanType": "overmind.tracing",
+    "capture_exception": "overmind.tracing",
+    "entry_point": "overmind.tracing",
+    "function": "overmind.tracing",
+    "get_tracer": "overmind.tracing",
+    "init": "overmind.tracing",
+    "observe": "overmind.tracing",
+    "set_tag": "overmind.tracing",
+    "set_user": "overmind.tracing",
+    "start_span": "overmind.tracing",
+    "tool": "overmind.tracing",
+    "workflow": "overmind.tracing",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        # submodules such as ``overmind.tracing`` used to be bound by the eager imports
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        globals()[name] = value
+        return value
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
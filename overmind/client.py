@@ -2,31 +2,67 @@
 Overmind layers client.
 """
 
+import json
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Sequence
 from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import OvermindAPIError
 from .models import LayerResponse
 from .utils.api_settings import get_api_settings
 
+# The layers client is shared process-wide (see get_layers_client), so keep
+# enough pooled keep-alive connections around for concurrent callers.
+_POOL_SIZE = 32
+
+# Inputs longer than this are never cached, to keep the result cache small.
+_MAX_CACHEABLE_INPUT_LEN = 32_000
+
 
 class OvermindLayersClient:
+    """
+    Client for running Overmind layers.
+
+    Args:
+        overmind_api_key: Your Overmind API key. If not provided, uses OVERMIND_API_KEY env var.
+        base_url: Base URL of the Overmind API. If not provided, uses OVERMIND_API_URL env var.
+        result_cache_size: Number of layer results to keep in an in-memory LRU cache, keyed by
+                           input data, policies, layer position and kwargs. Disabled (0) by default;
+                           only enable it for deterministic policies, as a cache hit returns a copy of
+                           the original response, including the span context of the original call.
+        result_cache_ttl: Seconds a cached layer result stays valid, so server-side policy changes are
+                          picked up. Defaults to 300.
+    """
+
     def __init__(
         self,
         overmind_api_key: str | None = None,
         base_url: str | None = None,
         traces_base_url: str | None = None,
+        result_cache_size: int = 0,
+        result_cache_ttl: float = 300.0,
     ):
         self.overmind_api_key, self.base_url = get_api_settings(overmind_api_key, base_url)
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "X-API-Token": self.overmind_api_key,
                 "Content-Type": "application/json",
             }
         )
+        self.result_cache_size = result_cache_size
+        self.result_cache_ttl = result_cache_ttl
+        # cache key -> (monotonic time the result was stored, result)
+        self._result_cache: OrderedDict[str, tuple[float, LayerResponse]] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     def run_layer(
         self, input_data: str, policies: Sequence[str | dict], layer_position: str, **kwargs
@@ -41,6 +77,19 @@ class OvermindLayersClient:
             "kwargs": kwargs,
         }
 
+        cache_key = None
+        if self.result_cache_size > 0 and len(input_data) <= _MAX_CACHEABLE_INPUT_LEN:
+            cache_key = json.dumps(payload, sort_keys=True)
+            with self._result_cache_lock:
+                entry = self._result_cache.get(cache_key)
+                if entry is not None:
+                    stored_at, cached = entry
+                    if time.monotonic() - stored_at < self.result_cache_ttl:
+                        self._result_cache.move_to_end(cache_key)
+                        # hand out a copy so callers can't mutate the cached result
+                        return cached.model_copy(deep=True)
+                    del self._result_cache[cache_key]
+
         response_data = self.session.request("POST", f"{self.base_url}/api/v1/layers/run", json=payload)
 
         if response_data.status_code != 200:
@@ -50,7 +99,17 @@ class OvermindLayersClient:
                 response_data=response_data.json(),
             )
 
-        return LayerResponse(**response_data.json())
+        # parse and validate in a single pass over the raw body
+        layer_response = LayerResponse.model_validate_json(response_data.content)
+
+        if cache_key is not None:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = (time.monotonic(), layer_response.model_copy(deep=True))
+                self._result_cache.move_to_end(cache_key)
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+
+        return layer_response
 
 
 @lru_cache
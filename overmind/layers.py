@@ -5,6 +5,8 @@ from overmind.models import LayerResponse
 
 
 class GenericOvermindLayer:
+    __slots__ = ("layer_position", "layers_client", "policies")
+
     def __init__(
         self,
         policies: Sequence[str | dict],
@@ -25,6 +27,8 @@ class AnonymizePIILayer(GenericOvermindLayer):
     Anonymize PII data in the state.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         pii_types: dict[str, str] | None = None,
@@ -47,6 +51,8 @@ class RejectPromptInjectionLayer(GenericOvermindLayer):
     Inject a reject prompt into the state.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         layer_position: str = "input",
@@ -61,6 +67,8 @@ class RejectIrrelevantAnswersLayer(GenericOvermindLayer):
     Reject answers that are irrelevant to the question.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         layer_position: str = "output",
@@ -75,6 +83,8 @@ class LLMJudgeScorerLayer(GenericOvermindLayer):
     Judge the LLM's response according to a list of criteria. Each criterion should evaluate to true or false.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         criteria: list[str],
@@ -96,6 +106,8 @@ class LLMJudgeScorerLayerQA(GenericOvermindLayer):
     Judge the LLM's response according to a list of criteria. Each criterion should evaluate to true or false.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         criteria: list[str],
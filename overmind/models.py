@@ -7,7 +7,6 @@ from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
-from rich.console import Console
 
 
 class ReadableBaseModel(BaseModel):
@@ -19,6 +18,8 @@ class ReadableBaseModel(BaseModel):
 
         This is called by the Python REPL when you inspect an object.
         """
+        from rich.console import Console
+
         string_buffer = io.StringIO()
         console = Console(file=string_buffer, force_terminal=True)
         console.print(self)
@@ -31,8 +32,8 @@ class AgentCreateRequest(ReadableBaseModel):
     agent_id: str = Field(..., description="Unique identifier for the agent")
     agent_model: str | None = Field(None, description="The AI model to use (e.g., 'gpt-5-mini')")
     agent_description: str | None = Field(None, description="Description of the agent")
-    stats: dict[str, Any] | None = Field(default={}, description="Agent statistics")
-    parameters: dict[str, Any] | None = Field(default={}, description="Agent parameters")
+    stats: dict[str, Any] | None = Field(default_factory=dict, description="Agent statistics")
+    parameters: dict[str, Any] | None = Field(default_factory=dict, description="Agent parameters")
 
 
 class AgentUpdateRequest(ReadableBaseModel):
@@ -10,10 +10,11 @@ import importlib.util
 import inspect
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import contextmanager
 from enum import Enum
 from functools import wraps
+from pathlib import PurePath
 from typing import Any
 
 from opentelemetry import trace
@@ -36,6 +37,8 @@ except importlib.metadata.PackageNotFoundError:
     _SDK_VERSION = "unknown"
 
 _strict_mode = os.environ.get("OVERMIND_STRICT_MODE", "false").lower() == "true"
+# OVERMIND_TRACING=false (or 0) makes the tracing decorators return functions unwrapped
+_tracing_disabled = os.environ.get("OVERMIND_TRACING", "true").lower() in ("false", "0")
 
 # Global state to track initialization
 _initialized = False
@@ -133,20 +136,26 @@ def enable_google_genai():
     logger.info("%s instrumentation enabled", name)
 
 
-def enable_tracing(providers: list[str]):
-    if providers == []:
+# Providers enabled when init() is called without an explicit list
+_DEFAULT_PROVIDERS = ("openai", "anthropic", "google", "agno")
+
+_PROVIDER_ENABLERS: dict[str, Callable[[], None]] = {
+    "agno": enable_agno,
+    "openai": enable_openai,
+    "anthropic": enable_anthropic,
+    "google": enable_google_genai,
+}
+
+
+def enable_tracing(providers: Sequence[str]):
+    if not providers:
         # if no providers are provided, enable all supported providers
-        providers = ["openai", "anthropic", "google", "agno"]
+        providers = _DEFAULT_PROVIDERS
 
     logger.info("Enabling tracing for providers: %s", providers)
-    if "agno" in providers:
-        enable_agno()
-    if "openai" in providers:
-        enable_openai()
-    if "anthropic" in providers:
-        enable_anthropic()
-    if "google" in providers:
-        enable_google_genai()
+    for name, enable in _PROVIDER_ENABLERS.items():
+        if name in providers:
+            enable()
 
 
 def _span_processor_on_start(span: trace.Span, parent_context: trace.Context | None = None):
@@ -166,6 +175,7 @@ def init(
     environment: str | None = None,
     providers: list[str] | None = None,
     overmind_base_url: str | None = None,
+    span_processor_options: dict[str, int] | None = None,
 ):
     """
     Initialize the Overmind SDK for automatic monitoring.
@@ -182,11 +192,14 @@ def init(
                      OVERMIND_ENVIRONMENT env var or "development".
         providers: List of providers to trace. Supported values: "openai", "anthropic", "google", "agno".
         overmind_base_url: Base URL for traces. If not provided, uses OVERMIND_API_URL env var.
+        span_processor_options: Extra keyword arguments for the BatchSpanProcessor, e.g.
+                                {"max_queue_size": 8192, "max_export_batch_size": 1024}.
+                                Only applied on the first call.
     """
     global _initialized, _tracer
 
     if providers is None:
-        providers = []
+        providers = ()
 
     if _initialized:
         # user can call init again with different providers, so we should not skip
@@ -223,7 +236,7 @@ def init(
 
     otlp_exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers)
 
-    span_processor = BatchSpanProcessor(otlp_exporter)
+    span_processor = BatchSpanProcessor(otlp_exporter, **(span_processor_options or {}))
     provider.add_span_processor(span_processor)
     span_processor.on_start = _span_processor_on_start
 
@@ -360,10 +373,14 @@ class SpanType(str, Enum):
     TOOL = "tool"
 
 
-_SKIP_INPUT_TYPES = (
+_SKIP_INPUT_TYPES = frozenset({
     "Console", "Progress", "Live", "Table", "Panel",
     "TracerProvider", "Tracer", "Span",
-)
+})
+
+# Exact types that _prepare_for_otel returns unchanged, checked with a single
+# set lookup before falling back to the isinstance/hasattr chain.
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None), dict, list, tuple})
 
 
 def _should_skip_value(value: Any) -> bool:
@@ -372,6 +389,9 @@ def _should_skip_value(value: Any) -> bool:
 
 
 def _prepare_for_otel(value: Any) -> Any:
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+
     if isinstance(value, (str, int, float, bool, type(None))):
         return value
 
@@ -390,7 +410,6 @@ def _prepare_for_otel(value: Any) -> Any:
     if isinstance(value, (set, frozenset)):
         return list(value)
 
-    from pathlib import PurePath
     if isinstance(value, PurePath):
         return str(value)
 
@@ -418,11 +437,44 @@ def observe(span_name: str | None = None, type: SpanType = SpanType.FUNCTION):
 
     Captures function inputs and outputs as span attributes in OTEL style.
     Works with both synchronous and asynchronous functions.
+
+    If the OVERMIND_TRACING env var is set to "false" (or "0"), functions are
+    returned as-is, without a wrapper.
     """
 
     def decorator(func: Callable) -> Callable:
+        if _tracing_disabled:
+            return func
+
         name = span_name or func.__name__
 
+        # resolve the signature once, rather than on every call
+        param_names = tuple(inspect.signature(func).parameters)
+        num_params = len(param_names)
+        is_method = num_params > 0 and param_names[0] in ("self", "cls")
+        start_idx = 1 if is_method else 0
+
+        def collect_inputs(args: tuple, kwargs: dict) -> dict[str, Any]:
+            inputs = {}
+            # plain values are left for serialize() to handle, only other objects are prepared
+            # (`type` is shadowed by the span type argument here, hence __class__)
+            for i in range(start_idx, len(args)):
+                arg = args[i]
+                if arg.__class__ not in _PASSTHROUGH_TYPES:
+                    if _should_skip_value(arg):
+                        continue
+                    arg = _prepare_for_otel(arg)
+                param_name = param_names[i] if i < num_params else f"arg_{i}"
+                inputs[param_name] = arg
+
+            for key, value in kwargs.items():
+                if value.__class__ not in _PASSTHROUGH_TYPES:
+                    if _should_skip_value(value):
+                        continue
+                    value = _prepare_for_otel(value)
+                inputs[key] = value
+            return inputs
+
         is_async = inspect.iscoroutinefunction(func)
 
         if is_async:
@@ -430,35 +482,24 @@ def observe(span_name: str | None = None, type: SpanType = SpanType.FUNCTION):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 tracer = get_tracer()
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                is_method = len(param_names) > 0 and param_names[0] in ("self", "cls")
-                start_idx = 1 if is_method else 0
+                if isinstance(tracer, trace.NoOpTracer):
+                    # tracing is disabled (e.g. OTEL_SDK_DISABLED), don't pay for a span
+                    return await func(*args, **kwargs)
 
                 with tracer.start_as_current_span(name) as otel_span:
                     try:
                         otel_span.set_attribute("name", name)
                         otel_span.set_attribute("type", type.value)
 
-                        inputs = {}
-                        for i, arg in enumerate(args[start_idx:], start=start_idx):
-                            if _should_skip_value(arg):
-                                continue
-                            param_name = param_names[i] if i < len(param_names) else f"arg_{i}"
-                            inputs[param_name] = _prepare_for_otel(arg)
-
-                        for key, value in kwargs.items():
-                            if _should_skip_value(value):
-                                continue
-                            inputs[key] = _prepare_for_otel(value)
-
-                        otel_span.set_attribute("inputs", serialize(inputs))
+                        # skip building inputs/outputs for spans that will be dropped anyway
+                        recording = otel_span.is_recording()
+                        if recording:
+                            otel_span.set_attribute("inputs", serialize(collect_inputs(args, kwargs)))
 
                         result = await func(*args, **kwargs)
 
-                        output = _prepare_for_otel(result)
-                        otel_span.set_attribute("outputs", serialize(output))
+                        if recording:
+                            otel_span.set_attribute("outputs", serialize(_prepare_for_otel(result)))
 
                         otel_span.set_status(Status(StatusCode.OK))
 
@@ -475,35 +516,24 @@ def observe(span_name: str | None = None, type: SpanType = SpanType.FUNCTION):
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 tracer = get_tracer()
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-                is_method = len(param_names) > 0 and param_names[0] in ("self", "cls")
-                start_idx = 1 if is_method else 0
+                if isinstance(tracer, trace.NoOpTracer):
+                    # tracing is disabled (e.g. OTEL_SDK_DISABLED), don't pay for a span
+                    return func(*args, **kwargs)
 
                 with tracer.start_as_current_span(name) as otel_span:
                     try:
                         otel_span.set_attribute("name", name)
                         otel_span.set_attribute("type", type.value)
 
-                        inputs = {}
-                        for i, arg in enumerate(args[start_idx:], start=start_idx):
-                            if _should_skip_value(arg):
-                                continue
-                            param_name = param_names[i] if i < len(param_names) else f"arg_{i}"
-                            inputs[param_name] = _prepare_for_otel(arg)
-
-                        for key, value in kwargs.items():
-                            if _should_skip_value(value):
-                                continue
-                            inputs[key] = _prepare_for_otel(value)
-
-                        otel_span.set_attribute("inputs", serialize(inputs))
+                        # skip building inputs/outputs for spans that will be dropped anyway
+                        recording = otel_span.is_recording()
+                        if recording:
+                            otel_span.set_attribute("inputs", serialize(collect_inputs(args, kwargs)))
 
                         result = func(*args, **kwargs)
 
-                        output = _prepare_for_otel(result)
-                        otel_span.set_attribute("outputs", serialize(output))
+                        if recording:
+                            otel_span.set_attribute("outputs", serialize(_prepare_for_otel(result)))
 
                         otel_span.set_status(Status(StatusCode.OK))
 
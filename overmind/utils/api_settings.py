@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 LOCAL_API_KEY_PREFIX = "ovr_core_"
 LOCAL_BASE_URL = "http://localhost:8000"
@@ -9,7 +10,23 @@ def get_api_settings(
     overmind_api_key: str | None = None,
     base_url: str | None = None,
 ) -> tuple[str, str]:
-    overmind_api_key = overmind_api_key or os.getenv("OVERMIND_API_KEY")
+    # env vars are part of the cache key, so changes to them are still picked up
+    return _resolve_api_settings(
+        overmind_api_key,
+        base_url,
+        os.getenv("OVERMIND_API_KEY"),
+        os.getenv("OVERMIND_API_URL"),
+    )
+
+
+@lru_cache(maxsize=8)
+def _resolve_api_settings(
+    overmind_api_key: str | None,
+    base_url: str | None,
+    env_api_key: str | None,
+    env_base_url: str | None,
+) -> tuple[str, str]:
+    overmind_api_key = overmind_api_key or env_api_key
     if not overmind_api_key:
         return None, None
 
@@ -17,7 +34,7 @@ def get_api_settings(
     default_url = LOCAL_BASE_URL if is_local else DEFAULT_BASE_URL
 
     if base_url is None:
-        base_url = os.getenv("OVERMIND_API_URL") or default_url
+        base_url = env_base_url or default_url
 
     base_url = base_url.rstrip("/")
 
@@ -1,19 +1,36 @@
 import csv
-import json
-from collections.abc import Iterator
+import logging
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 from pathlib import Path
 
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import from_json
 from tqdm import tqdm
 
 from overmind.tracing import get_tracer, init
 
+logger = logging.getLogger(__name__)
+
+# Bulk ingestion creates spans much faster than the default BatchSpanProcessor
+# settings can export them, which would drop spans once the queue fills up.
+_INGEST_SPAN_PROCESSOR_OPTIONS = {
+    "max_queue_size": 8192,
+    "max_export_batch_size": 1024,
+    "schedule_delay_millis": 1000,
+}
+
 
 def get_log_item_model(mapping: dict[str, str] | None = None):
-    if mapping is None:
-        mapping = {}
+    # building a model class is expensive, so classes are cached per mapping
+    return _build_log_item_model(frozenset((mapping or {}).items()))
+
+
+@lru_cache(maxsize=32)
+def _build_log_item_model(mapping_items: frozenset[tuple[str, str]]):
+    mapping = dict(mapping_items)
 
     def get_field(name: str):
         return mapping.get(name, name)
@@ -48,9 +65,12 @@ def get_log_item_model(mapping: dict[str, str] | None = None):
     return LogItem
 
 
-def process_log_item(item: dict, mapping: dict[str, str]):
-    log_model = get_log_item_model(mapping)
-    log_item = log_model.model_validate(item, by_alias=True)
+def process_log_item(item: dict | str | bytes, log_model: type[BaseModel]):
+    if isinstance(item, dict):
+        log_item = log_model.model_validate(item, by_alias=True)
+    else:
+        # raw JSON (e.g. a JSONL line) is parsed and validated in a single pass
+        log_item = log_model.model_validate_json(item, by_alias=True)
 
     ctx = {}
     if log_item.trace_id:
@@ -85,15 +105,15 @@ def process_log_item(item: dict, mapping: dict[str, str]):
     span.end(end_time=log_item.end_time)
 
 
-def load_from_jsonl(filepath: str) -> Iterator[dict]:
-    with open(filepath, "r") as f:
-        for line in f:
-            yield json.loads(line)
+def load_from_jsonl(filepath: str) -> Iterator[bytes]:
+    # lines are left as raw JSON bytes, process_log_item validates them directly
+    with open(filepath, "rb") as f:
+        yield from f
 
 
 def load_from_json(filepath: str) -> Iterator[dict]:
-    with open(filepath, "r") as f:
-        data = json.load(f)
+    with open(filepath, "rb") as f:
+        data = from_json(f.read())
         yield from data
 
 
@@ -103,28 +123,32 @@ def load_from_csv(filepath: str) -> Iterator[dict]:
         yield from reader
 
 
+_LOADERS: dict[str, Callable[[str], Iterator[dict | bytes]]] = {
+    ".jsonl": load_from_jsonl,
+    ".json": load_from_json,
+    ".csv": load_from_csv,
+}
+
+
 def ingest_logs(filepath: str, mapping: dict[str, str], **kwargs):
     if kwargs.get("overmind_api_key"):
-        init(overmind_api_key=kwargs.get("overmind_api_key"))
+        init(overmind_api_key=kwargs.get("overmind_api_key"), span_processor_options=_INGEST_SPAN_PROCESSOR_OPTIONS)
     else:
-        init()
+        init(span_processor_options=_INGEST_SPAN_PROCESSOR_OPTIONS)
 
     suffix = Path(filepath).suffix
-    items: list[dict] = []
-    if suffix == ".jsonl":
-        items = load_from_jsonl(filepath)
-    elif suffix == ".json":
-        items = load_from_json(filepath)
-    elif suffix == ".csv":
-        items = load_from_csv(filepath)
-    else:
+    loader = _LOADERS.get(suffix)
+    if loader is None:
         raise ValueError(f"Unsupported file extension: {suffix}")
+    items = loader(filepath)
 
-    for i, dict_item in tqdm(enumerate(items)):
+    # build the (dynamic) model class once, not once per row
+    log_model = get_log_item_model(mapping)
+    for i, item in enumerate(tqdm(items, mininterval=0.5)):
         try:
-            process_log_item(dict_item, mapping)
+            process_log_item(item, log_model)
         except Exception as trace_ex:
-            print(f"Failed to record span for line {i}: {trace_ex}")
+            logger.warning("Failed to record span for line %d: %s", i, trace_ex)
             continue
 
 
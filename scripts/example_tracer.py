@@ -1,5 +1,7 @@
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 import openai
 from overmind import init, tool, workflow, entry_point
 
@@ -33,16 +35,22 @@ yahoo_finance_tool = YahooFinanceTool()
 def stock_agent(stock_symbol: str):
     """Agent which aggregates stock price, latest news, and OpenAI analysis for a stock."""
 
-    price = yahoo_finance_tool.get_stock_price(stock_symbol)
-    news = websearch_tool.search(stock_symbol)
-
-    prompt = (
-        f"Stock symbol: {stock_symbol}\n"
-        f"Latest price: ${price}\n"
-        f"News headlines:\n"
-        + "\n".join(f"- {item}" for item in news)
-        + "\n\nSummarize the current state of this stock and recent news in plain English."
-    )
+    # The two tool calls are independent, so run them concurrently. Each task runs in a
+    # copy of the current context so its span is still nested under this workflow span.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        price_future = executor.submit(copy_context().run, yahoo_finance_tool.get_stock_price, stock_symbol)
+        news_future = executor.submit(copy_context().run, websearch_tool.search, stock_symbol)
+        price = price_future.result()
+        news = news_future.result()
+
+    prompt = "\n".join([
+        f"Stock symbol: {stock_symbol}",
+        f"Latest price: ${price}",
+        "News headlines:",
+        *(f"- {item}" for item in news),
+        "",
+        "Summarize the current state of this stock and recent news in plain English.",
+    ])
 
     openai_response = openai_client.chat.completions.create(
         model="gpt-5-mini",
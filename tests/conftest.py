@@ -5,13 +5,25 @@ Shared pytest fixtures and configuration.
 from unittest.mock import Mock
 
 import pytest
+import requests
+
+
+@pytest.fixture(scope="session")
+def mock_response_factory():
+    """Return a callable that builds mock HTTP responses."""
+
+    def make_response(content: bytes = b'{"status": "success"}', status_code: int = 200, json_data=None):
+        return Mock(
+            spec=requests.Response,
+            status_code=status_code,
+            content=content,
+            json=Mock(return_value={"status": "success"} if json_data is None else json_data),
+        )
+
+    return make_response
 
 
 @pytest.fixture
-def mock_response():
+def mock_response(mock_response_factory):
     """Create a mock response object."""
-    response = Mock()
-    response.status_code = 200
-    response.content = b'{"status": "success"}'
-    response.json.return_value = {"status": "success"}
-    return response
+    return mock_response_factory()
@@ -0,0 +1,121 @@
+"""
+Tests for the Overmind layers client.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from overmind.client import OvermindLayersClient
+from overmind.exceptions import OvermindAPIError
+
+LAYER_RESPONSE_BODY = (
+    b'{"policy_results": {}, "overall_policy_outcome": "passed", "processed_data": "hello", "span_context": {}}'
+)
+
+
+@pytest.fixture
+def layer_response(mock_response_factory):
+    return mock_response_factory(LAYER_RESPONSE_BODY)
+
+
+def make_client(**kwargs) -> OvermindLayersClient:
+    client = OvermindLayersClient(overmind_api_key="test_key", base_url="http://test.com", **kwargs)
+    client.session.request = Mock()
+    return client
+
+
+def test_run_layer(layer_response):
+    """Test that run_layer posts the layer payload and parses the response."""
+    client = make_client()
+    client.session.request.return_value = layer_response
+
+    result = client.run_layer("hello", ["anonymize_pii"], "input")
+
+    assert result.overall_policy_outcome == "passed"
+    assert result.processed_data == "hello"
+    client.session.request.assert_called_once()
+    args, kwargs = client.session.request.call_args
+    assert args == ("POST", "http://test.com/api/v1/layers/run")
+    assert kwargs["json"]["policies"] == ["anonymize_pii"]
+
+
+def test_run_layer_result_cache_disabled_by_default(layer_response):
+    """Test that identical calls hit the API every time without a result cache."""
+    client = make_client()
+    client.session.request.return_value = layer_response
+
+    client.run_layer("hello", ["anonymize_pii"], "input")
+    client.run_layer("hello", ["anonymize_pii"], "input")
+
+    assert client.session.request.call_count == 2
+
+
+def test_run_layer_result_cache(layer_response):
+    """Test that identical calls are served from the result cache, and the cache is bounded."""
+    client = make_client(result_cache_size=1)
+    client.session.request.return_value = layer_response
+
+    first = client.run_layer("hello", ["anonymize_pii"], "input")
+    second = client.run_layer("hello", ["anonymize_pii"], "input")
+    assert second == first
+    assert client.session.request.call_count == 1
+
+    client.run_layer("other", ["anonymize_pii"], "input")
+    client.run_layer("hello", ["anonymize_pii"], "input")
+    assert client.session.request.call_count == 3
+
+
+def test_run_layer_result_cache_returns_independent_copies(layer_response):
+    """Test that mutating a returned result does not leak into later cache hits."""
+    client = make_client(result_cache_size=1)
+    client.session.request.return_value = layer_response
+
+    first = client.run_layer("hello", ["anonymize_pii"], "input")
+    first.processed_data = "MUTATED"
+    second = client.run_layer("hello", ["anonymize_pii"], "input")
+    second.span_context["mutated"] = True
+    third = client.run_layer("hello", ["anonymize_pii"], "input")
+
+    assert client.session.request.call_count == 1
+    assert second is not first
+    assert third.processed_data == "hello"
+    assert third.span_context == {}
+
+
+def test_run_layer_result_cache_expires(layer_response, monkeypatch):
+    """Test that cached results older than the TTL are fetched again."""
+    now = [1000.0]
+    monkeypatch.setattr("overmind.client.time.monotonic", lambda: now[0])
+    client = make_client(result_cache_size=1, result_cache_ttl=300)
+    client.session.request.return_value = layer_response
+
+    client.run_layer("hello", ["anonymize_pii"], "input")
+    now[0] += 299
+    client.run_layer("hello", ["anonymize_pii"], "input")
+    assert client.session.request.call_count == 1
+
+    now[0] += 1
+    client.run_layer("hello", ["anonymize_pii"], "input")
+    assert client.session.request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "status_code,body",
+    [
+        (400, {"detail": "Bad request"}),
+        (401, {"detail": "Invalid token"}),
+        (500, {"detail": "Internal server error"}),
+    ],
+)
+def test_run_layer_api_error(mock_response_factory, status_code, body):
+    """Test that non-200 responses raise OvermindAPIError with the status and body."""
+    client = make_client()
+    client.session.request.return_value = mock_response_factory(json.dumps(body).encode(), status_code, body)
+
+    with pytest.raises(OvermindAPIError) as exc_info:
+        client.run_layer("hello", ["anonymize_pii"], "input")
+
+    assert exc_info.value.status_code == status_code
+    assert exc_info.value.response_data == body
@@ -1,6 +1,5 @@
 import pytest
 import os
-import unittest
 from unittest.mock import MagicMock
 from overmind.utils.dump_logs import ingest_logs
 
@@ -8,21 +7,26 @@ from overmind.utils.dump_logs import ingest_logs
 current_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 
-@unittest.mock.patch("overmind.utils.dump_logs.get_tracer")
-@unittest.mock.patch("overmind.utils.dump_logs.init")
+@pytest.fixture
+def dump_logs_mocks(monkeypatch):
+    init_mock = MagicMock(return_value=None)
+    get_tracer_mock = MagicMock()
+    monkeypatch.setattr("overmind.utils.dump_logs.init", init_mock)
+    monkeypatch.setattr("overmind.utils.dump_logs.get_tracer", get_tracer_mock)
+    return init_mock, get_tracer_mock
+
+
 @pytest.mark.parametrize("filepath", ["logs.jsonl", "logs.json", "logs.csv"])
-def test_dump_logs(init_mock: MagicMock, mock_get_tracer: MagicMock, filepath):
-    init_mock.return_value = None
+def test_dump_logs(dump_logs_mocks, filepath):
+    init_mock, mock_get_tracer = dump_logs_mocks
     ingest_logs(os.path.join(current_dir, filepath), {})
     init_mock.assert_called()
     mock_get_tracer.assert_called()
 
 
-@unittest.mock.patch("overmind.utils.dump_logs.get_tracer")
-@unittest.mock.patch("overmind.utils.dump_logs.init")
 @pytest.mark.parametrize("filepath", ["logs_mapped.jsonl", "logs_mapped.json", "logs_mapped.csv"])
-def test_dump_logs_with_mapping(init_mock: MagicMock, mock_get_tracer: MagicMock, filepath):
-    init_mock.return_value = None
+def test_dump_logs_with_mapping(dump_logs_mocks, filepath):
+    init_mock, mock_get_tracer = dump_logs_mocks
     ingest_logs(
         os.path.join(current_dir, filepath),
         {
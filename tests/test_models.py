@@ -7,21 +7,32 @@ import pytest
 from overmind.models import AgentCreateRequest
 
 
-class TestModels:
-    """Test cases for Pydantic models."""
-
-    def test_agent_create_request(self):
-        """Test AgentCreateRequest model."""
-        agent_data = {
+@pytest.mark.parametrize(
+    "agent_data",
+    [
+        {
             "agent_id": "test_agent",
             "agent_model": "gpt-5-mini",
             "agent_description": "Test agent",
-        }
-
-        agent = AgentCreateRequest(**agent_data)
-        assert agent.agent_id == "test_agent"
-        assert agent.agent_model == "gpt-5-mini"
-        assert agent.agent_description == "Test agent"
+        },
+        {
+            "agent_id": "test_agent",
+            "agent_model": "gpt-5-mini",
+            "agent_description": "Test agent",
+            "stats": {"invocations": 3},
+            "parameters": {"temperature": 0.2},
+        },
+    ],
+    ids=["minimal", "with_stats_and_parameters"],
+)
+def test_agent_create_request(agent_data):
+    """Test AgentCreateRequest model."""
+    agent = AgentCreateRequest(**agent_data)
+    assert agent.agent_id == "test_agent"
+    assert agent.agent_model == "gpt-5-mini"
+    assert agent.agent_description == "Test agent"
+    assert agent.stats == agent_data.get("stats", {})
+    assert agent.parameters == agent_data.get("parameters", {})
 
 
 if __name__ == "__main__":
@@ -1,28 +1,24 @@
 import os
-from unittest.mock import patch, MagicMock
+import subprocess
+import sys
+import types
+from unittest.mock import patch, MagicMock, Mock
 import pytest
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+
+from overmind import tracing
 
 
 @pytest.fixture(autouse=True)
 def reset_sdk_state():
     """Reset SDK state before each test."""
-    import overmind.tracing as sdk
-
-    sdk._initialized = False
-    sdk._tracer = None
+    vars(tracing).update(_initialized=False, _tracer=None)
     yield
-    sdk._initialized = False
-    sdk._tracer = None
+    vars(tracing).update(_initialized=False, _tracer=None)
 
 
-@pytest.fixture
-def mock_opentelemetry():
-    """Mock all OpenTelemetry dependencies."""
-    mock_fastapi_class = MagicMock()
-    mock_openai_class = MagicMock()
-
+@pytest.fixture(scope="module")
+def _opentelemetry_patches():
+    """Install the OpenTelemetry patches once for the whole module."""
     with (
         patch("overmind.tracing.TracerProvider") as mock_provider,
         patch("overmind.tracing.OTLPSpanExporter") as mock_exporter,
@@ -42,28 +38,41 @@ def mock_opentelemetry():
         }
 
 
-def test_sdk_init_configures_tracing(mock_opentelemetry):
-    """Test that calling init configures OpenTelemetry correctly."""
-    from overmind import tracing
-
-    with (
-        patch.object(tracing, "FastAPIInstrumentor", create=True) as mock_fastapi,
-        patch.object(tracing, "OpenAIInstrumentor", create=True) as mock_openai,
+@pytest.fixture
+def mock_opentelemetry(_opentelemetry_patches):
+    """Mock all OpenTelemetry dependencies, with call history cleared for each test."""
+    for mock in _opentelemetry_patches.values():
+        mock.reset_mock()
+    return _opentelemetry_patches
+
+
+@pytest.fixture(scope="module")
+def stub_instrumentors():
+    """Stand in for the instrumentation packages imported dynamically by init()."""
+    stubs = {}
+    for module_name, class_name in (
+        ("opentelemetry.instrumentation.fastapi", "FastAPIInstrumentor"),
+        ("opentelemetry.instrumentation.openai", "OpenAIInstrumentor"),
     ):
-        # Mock the dynamic imports
-        with patch.dict(
-            "sys.modules",
-            {
-                "opentelemetry.instrumentation.fastapi": MagicMock(FastAPIInstrumentor=mock_fastapi),
-                "opentelemetry.instrumentation.openai": MagicMock(OpenAIInstrumentor=mock_openai),
-            },
-        ):
-            tracing.init(
-                overmind_api_key="test_key",
-                overmind_base_url="http://localhost:4318",
-                service_name="test-service",
-                environment="testing",
-            )
+        module = types.ModuleType(module_name)
+        setattr(module, class_name, Mock())
+        stubs[module_name] = module
+
+    # Only the stubbed keys are restored afterwards, unlike patch.dict on sys.modules
+    with pytest.MonkeyPatch.context() as mp:
+        for module_name, module in stubs.items():
+            mp.setitem(sys.modules, module_name, module)
+        yield stubs
+
+
+def test_sdk_init_configures_tracing(mock_opentelemetry, stub_instrumentors):
+    """Test that calling init configures OpenTelemetry correctly."""
+    tracing.init(
+        overmind_api_key="test_key",
+        overmind_base_url="http://localhost:4318",
+        service_name="test-service",
+        environment="testing",
+    )
 
     # Verify Exporter configuration
     mock_opentelemetry["exporter"].assert_called_with(
@@ -74,10 +83,21 @@ def test_sdk_init_configures_tracing(mock_opentelemetry):
     mock_opentelemetry["trace"].set_tracer_provider.assert_called_once()
 
 
+def test_sdk_init_span_processor_options(mock_opentelemetry):
+    """Test that span processor options are passed to the BatchSpanProcessor."""
+    tracing.init(
+        overmind_api_key="test_key",
+        overmind_base_url="http://localhost:4318",
+        span_processor_options={"max_queue_size": 8192},
+    )
+
+    mock_opentelemetry["processor"].assert_called_once_with(
+        mock_opentelemetry["exporter"].return_value, max_queue_size=8192
+    )
+
+
 def test_sdk_init_only_once():
     """Test that init only runs once."""
-    from overmind import tracing
-
     with (
         patch("overmind.tracing.TracerProvider"),
         patch("overmind.tracing.OTLPSpanExporter"),
@@ -93,8 +113,6 @@ def test_sdk_init_only_once():
 
 def test_sdk_init_handles_missing_deps():
     """Test that init doesn't crash if optional instrumentation libraries are missing."""
-    from overmind import tracing
-
     with (
         patch("overmind.tracing.TracerProvider"),
         patch("overmind.tracing.OTLPSpanExporter"),
@@ -107,16 +125,12 @@ def test_sdk_init_handles_missing_deps():
 
 def test_get_tracer_before_init():
     """Test that get_tracer raises if SDK not initialized."""
-    from overmind import tracing
-
     with pytest.raises(RuntimeError, match="not initialized"):
         tracing.get_tracer()
 
 
 def test_get_tracer_after_init(mock_opentelemetry):
     """Test that get_tracer returns tracer after init."""
-    from overmind import tracing
-
     tracing.init(overmind_api_key="test_key", overmind_base_url="http://localhost:4318")
 
     tracer = tracing.get_tracer()
@@ -125,8 +139,6 @@ def test_get_tracer_after_init(mock_opentelemetry):
 
 def test_set_user(mock_opentelemetry):
     """Test that set_user adds user attributes to current span."""
-    from overmind import tracing
-
     mock_span = MagicMock()
     mock_span.is_recording.return_value = True
     mock_opentelemetry["trace"].get_current_span.return_value = mock_span
@@ -140,8 +152,6 @@ def test_set_user(mock_opentelemetry):
 
 def test_set_tag(mock_opentelemetry):
     """Test that set_tag adds custom attributes to current span."""
-    from overmind import tracing
-
     mock_span = MagicMock()
     mock_span.is_recording.return_value = True
     mock_opentelemetry["trace"].get_current_span.return_value = mock_span
@@ -154,8 +164,6 @@ def test_set_tag(mock_opentelemetry):
 
 def test_capture_exception(mock_opentelemetry):
     """Test that capture_exception records exception on current span."""
-    from overmind import tracing
-
     mock_span = MagicMock()
     mock_span.is_recording.return_value = True
     mock_opentelemetry["trace"].get_current_span.return_value = mock_span
@@ -168,18 +176,27 @@ def test_capture_exception(mock_opentelemetry):
     mock_span.record_exception.assert_called_once_with(test_exception)
 
 
-def test_fastapi_request_flow():
-    """
-    Test that a FastAPI app works normally when instrumented.
-    """
-    app = FastAPI()
+@pytest.fixture(scope="module")
+def fastapi_client():
+    """FastAPI test client shared by the request-flow tests."""
+    # fastapi is a dev-only dependency, imported here so collection stays cheap
+    fastapi = pytest.importorskip("fastapi")
+    testclient = pytest.importorskip("fastapi.testclient")
+
+    app = fastapi.FastAPI()
 
     @app.get("/ping")
     def ping():
         return {"message": "pong"}
 
-    client = TestClient(app)
-    response = client.get("/ping")
+    return testclient.TestClient(app)
+
+
+def test_fastapi_request_flow(fastapi_client):
+    """
+    Test that a FastAPI app works normally when instrumented.
+    """
+    response = fastapi_client.get("/ping")
 
     assert response.status_code == 200
     assert response.json() == {"message": "pong"}
@@ -187,8 +204,6 @@ def test_fastapi_request_flow():
 
 def test_service_name_from_env():
     """Test that service name can be set via environment variable."""
-    from overmind import tracing
-
     with (
         patch("overmind.tracing.TracerProvider") as mock_provider,
         patch("overmind.tracing.OTLPSpanExporter"),
@@ -202,3 +217,16 @@ def test_service_name_from_env():
         # Check that Resource.create was called with the env service name
         call_args = mock_resource.create.call_args[0][0]
         assert call_args["service.name"] == "env-service"
+
+
+def test_package_import_is_lazy():
+    """Test that importing overmind defers loading tracing until a helper is accessed."""
+    code = (
+        "import sys\n"
+        "import overmind\n"
+        "assert 'overmind.tracing' not in sys.modules\n"
+        # submodules resolve on attribute access, before any lazy helper has loaded them
+        "assert overmind.utils.__name__ == 'overmind.utils'\n"
+        "assert overmind.tracing.init is overmind.init\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)